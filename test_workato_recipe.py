@@ -0,0 +1,164 @@
+import contextlib
+import io
+import unittest
+
+from workato_recipe import Action, Recipe, Trigger, create_example_recipe
+
+EXPECTED_EXAMPLE_OUTPUT = (
+    'Recipe: Example Recipe\n'
+    "(1) 1: T (input_schema={'schedule': <class 'str'>}, output_schema={'timestamp': <class 'str'>, 'event_id': <class 'str'>})\n"
+    "(2) 2: A1 (input_schema={'data': <class 'dict'>}, output_schema={'result': <class 'str'>, 'status': <class 'bool'>})\n"
+    "(3) 3: A2 (input_schema={'data': <class 'dict'>}, output_schema={'result': <class 'str'>, 'status': <class 'bool'>})\n"
+    "(4) 3.1: A2.1 (input_schema={'value': <class 'int'>}, output_schema={'processed_value': <class 'int'>})\n"
+    "(5) 3.2: A2.2 (input_schema={'value': <class 'int'>}, output_schema={'processed_value': <class 'int'>})\n"
+    "(6) 3.2.1: A2.2.1 (input_schema={'value': <class 'int'>}, output_schema={'processed_value': <class 'int'>})\n"
+    "(7) 4: A3 (input_schema={'data': <class 'dict'>}, output_schema={'result': <class 'str'>, 'status': <class 'bool'>})\n"
+)
+
+
+def _traverse_output(recipe) -> str:
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        recipe.traverse()
+    return buf.getvalue()
+
+
+class TraverseTest(unittest.TestCase):
+    def test_example_output(self):
+        self.assertEqual(_traverse_output(create_example_recipe()), EXPECTED_EXAMPLE_OUTPUT)
+
+    def test_deep_nesting_exceeds_recursion_limit(self):
+        recipe = Recipe("Deep", Trigger("T", {}, {}, "cron"))
+        parent = Action("A", {}, {}, "root")
+        recipe.add_action(parent)
+        for _ in range(5000):
+            child = Action("N", {}, {}, "nested")
+            parent.add_nested_action(child)
+            parent = child
+        lines = _traverse_output(recipe).splitlines()
+        self.assertEqual(len(lines), 5003)
+        self.assertTrue(lines[-1].startswith("(5002) 2" + ".1" * 5000 + ": N "))
+
+
+class IterChildrenTest(unittest.TestCase):
+    def test_trigger_has_no_children(self):
+        self.assertEqual(list(Trigger("T", {}, {}, "cron").iter_children()), [])
+
+    def test_action_yields_nested_actions_in_order(self):
+        first = Action("B", {}, {}, "t")
+        second = Action("C", {}, {}, "t")
+        action = Action("A", {}, {}, "t")
+        action.add_nested_action(first)
+        action.add_nested_action(second)
+        children = list(action.iter_children())
+        self.assertEqual(len(children), 2)
+        self.assertIs(children[0], first)
+        self.assertIs(children[1], second)
+
+
+class FinalizeTest(unittest.TestCase):
+    def test_add_action_raises_when_finalized(self):
+        recipe = create_example_recipe()
+        with self.assertRaisesRegex(RuntimeError, "finalized"):
+            recipe.add_action(Action("A4", {}, {}, "extra"))
+
+    def test_add_nested_action_raises_when_finalized(self):
+        recipe = create_example_recipe()
+        with self.assertRaisesRegex(RuntimeError, "finalized"):
+            recipe.actions[1].nested_actions[1].add_nested_action(Action("X", {}, {}, "extra"))
+
+    def test_unfreeze_allows_edits_again(self):
+        recipe = create_example_recipe()
+        recipe.unfreeze()
+        recipe.add_action(Action("A4", {}, {}, "extra"))
+        recipe.actions[1].nested_actions[1].add_nested_action(Action("X", {}, {}, "extra"))
+        output = _traverse_output(recipe)
+        self.assertIn("(7) 3.2.2: X ", output)
+        self.assertIn("(9) 5: A4 ", output)
+
+    def test_equality_unchanged_by_finalize(self):
+        trigger = Trigger("T", {}, {}, "cron")
+        first = Recipe("R", trigger, [Action("A", {}, {}, "t", [Action("B", {}, {}, "t")])])
+        second = Recipe("R", trigger, [Action("A", {}, {}, "t", [Action("B", {}, {}, "t")])])
+        self.assertEqual(first, second)
+        first.finalize()
+        self.assertEqual(first, second)
+        self.assertEqual(first.actions[0], second.actions[0])
+
+    def test_caller_lists_stay_attached(self):
+        nested = [Action("B", {}, {}, "t")]
+        actions = [Action("A", {}, {}, "t", nested)]
+        recipe = Recipe("R", Trigger("T", {}, {}, "cron"), actions)
+        recipe.finalize()
+        recipe.unfreeze()
+        self.assertIs(recipe.actions, actions)
+        self.assertIs(recipe.actions[0].nested_actions, nested)
+        nested.append(Action("C", {}, {}, "t"))
+        self.assertIn("(4) 2.2: C ", _traverse_output(recipe))
+
+    def test_unfreeze_without_finalize_is_harmless(self):
+        actions = [Action("A", {}, {}, "t")]
+        recipe = Recipe("R", Trigger("T", {}, {}, "cron"), actions)
+        recipe.unfreeze()
+        self.assertIs(recipe.actions, actions)
+        recipe.add_action(Action("B", {}, {}, "t"))
+        self.assertEqual(len(actions), 2)
+
+
+class CompileTraverserTest(unittest.TestCase):
+    def _call_output(self, func) -> str:
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            func()
+        return buf.getvalue()
+
+    def test_matches_traverse(self):
+        recipe = create_example_recipe()
+        self.assertEqual(self._call_output(recipe.compile_traverser()), _traverse_output(recipe))
+
+    def test_matches_traverse_with_quotes_in_names(self):
+        recipe = create_example_recipe()
+        recipe.name = "It's \"quoted\"\n"
+        recipe.actions[0].name = "A'1"
+        self.assertEqual(self._call_output(recipe.compile_traverser()), _traverse_output(recipe))
+
+    def test_is_a_snapshot(self):
+        recipe = create_example_recipe()
+        compiled = recipe.compile_traverser()
+        before = _traverse_output(recipe)
+        recipe.actions[0].name = "X"
+        self.assertEqual(self._call_output(compiled), before)
+
+
+class TraverseReflectsEditsTest(unittest.TestCase):
+    def setUp(self):
+        self.recipe = create_example_recipe()
+        self.recipe.unfreeze()
+        _traverse_output(self.recipe)
+
+    def test_actions_list_append(self):
+        self.recipe.actions.append(Action("A4", {}, {}, "extra"))
+        self.assertIn("(8) 5: A4 ", _traverse_output(self.recipe))
+
+    def test_trigger_reassigned(self):
+        self.recipe.trigger = Trigger("T2", {}, {}, "webhook")
+        self.assertIn("(1) 1: T2 ", _traverse_output(self.recipe))
+
+    def test_action_renamed(self):
+        self.recipe.actions[0].name = "X"
+        self.assertIn("(2) 2: X ", _traverse_output(self.recipe))
+
+    def test_schema_mutated(self):
+        schema = {"schedule": str}
+        self.recipe.trigger = Trigger("T", schema, {}, "cron")
+        _traverse_output(self.recipe)
+        schema["extra"] = int
+        self.assertIn("'extra': <class 'int'>", _traverse_output(self.recipe))
+
+    def test_nested_action_added(self):
+        self.recipe.actions[0].add_nested_action(Action("A1.1", {}, {}, "extra"))
+        self.assertIn("(3) 2.1: A1.1 ", _traverse_output(self.recipe))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,85 +1,162 @@
-from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Type
+"""Workato recipe components and traversal. Requires Python 3.10+ (slotted dataclasses)."""
+
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Any, Sequence, Tuple, Type
 from dataclasses import dataclass, field
 
 Schema = Dict[str, Type[Any]]
 
 
-@dataclass
-class RecipeComponent(ABC):
-    """Abstract base class for all recipe components."""
+_SMALL_INT_STRS: Tuple[str, ...] = tuple(map(str, range(1024)))
+
+
+def _int_str(value: int) -> str:
+    """Return str(value), precomputed for small values."""
+    return _SMALL_INT_STRS[value] if value < len(_SMALL_INT_STRS) else str(value)
+
+
+def _format_schema(schema: Schema, memo: Dict[int, str]) -> str:
+    """Format a schema, memoized by object identity in memo."""
+    formatted = memo.get(id(schema))
+    if formatted is None:
+        formatted = memo[id(schema)] = str(schema)
+    return formatted
+
+
+@dataclass(slots=True)
+class RecipeComponent:
+    """Base class for all recipe components."""
     name: str
     input_schema: Schema
     output_schema: Schema
     
-    @abstractmethod
-    def get_children(self) -> List['RecipeComponent']:
-        """Return list of child components."""
-        pass
+    def get_children(self) -> Sequence['RecipeComponent']:
+        """Return child components (do not mutate the result)."""
+        return ()
+    
+    def iter_children(self) -> Iterator['RecipeComponent']:
+        """Iterate over child components."""
+        return iter(())
 
 
-@dataclass
+@dataclass(slots=True)
 class Trigger(RecipeComponent):
     """Represents a recipe trigger (e.g., cron job, external event)."""
     trigger_type: str
-    
-    def get_children(self) -> List[RecipeComponent]:
-        return []
 
 
-@dataclass
+@dataclass(slots=True)
 class Action(RecipeComponent):
     """Represents a recipe action that can contain nested actions."""
     action_type: str
     nested_actions: List['Action'] = field(default_factory=list)
+    _frozen: bool = field(default=False, init=False, repr=False, compare=False)
     
     def add_nested_action(self, action: 'Action') -> None:
         """Add a nested action to this action."""
+        if self._frozen:
+            raise RuntimeError(
+                f"Action {self.name!r} is finalized; call Recipe.unfreeze() before adding nested actions"
+            )
         self.nested_actions.append(action)
     
-    def get_children(self) -> List[RecipeComponent]:
-        return list(self.nested_actions)
+    def get_children(self) -> Sequence[RecipeComponent]:
+        return self.nested_actions
+    
+    def iter_children(self) -> Iterator[RecipeComponent]:
+        return iter(self.nested_actions)
 
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
     """Represents a complete Workato recipe with trigger and actions."""
     name: str
     trigger: Trigger
     actions: List[Action] = field(default_factory=list)
+    _frozen: bool = field(default=False, init=False, repr=False, compare=False)
     
     def add_action(self, action: Action) -> None:
         """Add an action to the recipe."""
+        if self._frozen:
+            raise RuntimeError(
+                f"Recipe {self.name!r} is finalized; call unfreeze() before adding actions"
+            )
         self.actions.append(action)
     
+    def _iter_actions(self) -> Iterator[Action]:
+        """Yield every action in the recipe, including nested ones."""
+        stack: List[Action] = list(self.actions)
+        while stack:
+            action = stack.pop()
+            yield action
+            stack.extend(action.nested_actions)
+    
+    def finalize(self) -> None:
+        """Reject add_action and add_nested_action until unfreeze() is called."""
+        for action in self._iter_actions():
+            action._frozen = True
+        self._frozen = True
+    
+    def unfreeze(self) -> None:
+        """Allow add_action and add_nested_action again after finalize()."""
+        for action in self._iter_actions():
+            action._frozen = False
+        self._frozen = False
+    
+    def _collect_lines(self) -> List[str]:
+        """Walk the recipe depth-first and return one formatted line per component."""
+        schema_strs: Dict[int, str] = {}
+
+        # Iterative DFS with per-depth frame buffers; the root prefix is empty.
+        roots: List[RecipeComponent] = [self.trigger]
+        roots.extend(self.actions)
+        iter_stack: List[Iterator[Tuple[int, RecipeComponent]]] = [enumerate(roots, 1)]
+        prefix_stack: List[str] = [""]
+        depth = 0
+
+        lines: List[str] = []
+        global_counter = 0
+        while depth >= 0:
+            entry = next(iter_stack[depth], None)
+            if entry is None:
+                depth -= 1
+                continue
+            i, component = entry
+            index_str = _int_str(i)
+            prefix = prefix_stack[depth]
+            nested_index = prefix + "." + index_str if prefix else index_str
+            global_counter += 1
+
+            lines.append(f"({_int_str(global_counter)}) {nested_index}: {component.name} "
+                         f"(input_schema={_format_schema(component.input_schema, schema_strs)}, "
+                         f"output_schema={_format_schema(component.output_schema, schema_strs)})")
+
+            depth += 1
+            if depth == len(iter_stack):
+                iter_stack.append(enumerate(component.iter_children(), 1))
+                prefix_stack.append(nested_index)
+            else:
+                iter_stack[depth] = enumerate(component.iter_children(), 1)
+                prefix_stack[depth] = nested_index
+
+        return lines
+
+    def _render(self) -> str:
+        """Return the full traversal output."""
+        return "Recipe: " + self.name + "\n" + "\n".join(self._collect_lines()) + "\n"
+
     def traverse(self) -> None:
         """Traverse and print all recipe components with their schemas and indices."""
-        
-        def _traverse_component(
-            component: RecipeComponent,
-            global_counter: List[int],
-            nested_path: List[int]
-        ) -> None:
-            global_counter[0] += 1
-            current_global = global_counter[0]
-
-            nested_index = ".".join(map(str, nested_path))
-            
-            print(f"({current_global}) {nested_index}: {component.name} "
-                  f"(input_schema={component.input_schema}, output_schema={component.output_schema})")
-
-            children = component.get_children()
-            for i, child in enumerate(children, 1):
-                child_path = nested_path + [i]
-                _traverse_component(child, global_counter, child_path)
-        
-        print(f"Recipe: {self.name}")
-        
-        global_counter = [0]
-        _traverse_component(self.trigger, global_counter, [1])
-
-        for i, action in enumerate(self.actions, 2):
-            _traverse_component(action, global_counter, [i])
+        sys.stdout.write(self._render())
+
+    def compile_traverser(self) -> Callable[[], None]:
+        """Return a function that prints a snapshot of this recipe like `traverse`."""
+        output = self._render()
+
+        def _traverse() -> None:
+            sys.stdout.write(output)
+
+        return _traverse
 
 
 def create_example_recipe() -> Recipe:
@@ -150,6 +227,7 @@ def create_example_recipe() -> Recipe:
     recipe.add_action(a1)
     recipe.add_action(a2)
     recipe.add_action(a3)
+    recipe.finalize()
     
     return recipe
 